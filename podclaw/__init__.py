@@ -7,7 +7,15 @@ Generate full podcast episodes (script → TTS → video) from a single topic pr
 __version__ = "0.1.0"
 __author__ = "v0id_injector"
 
-from podclaw.generator import PodcastGenerator
 from podclaw.config import PodclawConfig, Voice, Format
 
 __all__ = ["PodcastGenerator", "PodclawConfig", "Voice", "Format"]
+
+
+def __getattr__(name: str):
+    # Import the pipeline on first use so `podclaw voices` etc. start fast
+    if name == "PodcastGenerator":
+        from podclaw.generator import PodcastGenerator
+
+        return PodcastGenerator
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -3,68 +3,105 @@ PodClaw CLI interface.
 """
 
 import argparse
+import re
 import sys
 import time
 
 from podclaw import __version__
 from podclaw.config import PodclawConfig, Format, VOICES
-from podclaw.generator import PodcastGenerator
+
+_FORMAT_MAP = {f.value: f for f in Format}
+_FORMAT_VALUES = ", ".join(_FORMAT_MAP)
+
+_FORMAT_DESCRIPTIONS = {
+    Format.DEBATE: "Two hosts debate opposing sides of the topic",
+    Format.MONOLOGUE: "Single host deep-dive on the topic",
+    Format.NEWS_RECAP: "Anchor + correspondent news-style coverage",
+    Format.INTERVIEW: "Interviewer + guest conversation",
+    Format.STORYTELLING: "Narrator + color commentary storytelling",
+}
+_FORMAT_ROWS = tuple(
+    f"  {value:<16} {_FORMAT_DESCRIPTIONS.get(fmt, '')}" for value, fmt in _FORMAT_MAP.items()
+)
+
+# Scripts are a few KB; anything past this is almost certainly the wrong file
+_MAX_SCRIPT_BYTES = 4 * 1024 * 1024
+
+
+# "<min>m<sec>s" with either part optional; a bare number is seconds
+_DURATION_RE = re.compile(r"(?:(\d+)\s*m)?\s*(?:(\d+)\s*s?)?")
 
 
 def _parse_duration(s: str) -> int:
     """Parse duration string like '2m', '90s', '1m30s' to seconds."""
-    s = s.strip().lower()
-
-    if s.endswith("s") and "m" not in s:
-        return int(s[:-1])
-    if s.endswith("m") and "s" not in s:
-        return int(s[:-1]) * 60
+    m = _DURATION_RE.fullmatch(s.strip().lower())
+    if not m or not any(m.groups()):
+        raise ValueError(f"Invalid duration: {s!r} (use e.g. 90s, 2m, 1m30s)")
+
+    minutes, seconds = m.groups()
+    return int(minutes or 0) * 60 + int(seconds or 0)
+
+
+def _read_script(path: str) -> str:
+    """
+    Read a --script file as UTF-8 text with CRLF and CR newlines normalized.
+
+    Raises:
+        ValueError: If the file is over _MAX_SCRIPT_BYTES or not valid UTF-8.
+    """
+    with open(path, "rb") as f:
+        data = f.read(_MAX_SCRIPT_BYTES + 1)
+    if len(data) > _MAX_SCRIPT_BYTES:
+        raise ValueError(
+            f"Script file is too large: {path} "
+            f"(limit {_MAX_SCRIPT_BYTES // (1024 * 1024)} MiB)"
+        )
+    try:
+        text = data.decode("utf-8")
+    except UnicodeDecodeError as e:
+        raise ValueError(f"Script file is not valid UTF-8: {path} ({e})") from e
+    # Same line endings a text-mode open() would have accepted
+    return text.replace("\r\n", "\n").replace("\r", "\n")
 
-    # Handle '1m30s' format
-    total = 0
-    if "m" in s:
-        parts = s.split("m")
-        total += int(parts[0]) * 60
-        rest = parts[1]
-        if rest.endswith("s"):
-            rest = rest[:-1]
-        if rest:
-            total += int(rest)
-    else:
-        total = int(s)
 
-    return total
+_ICONS = {
+    "script": "📝",
+    "tts": "🎙️",
+    "audio": "🎵",
+    "subtitles": "💬",
+    "video": "🎬",
+    "done": "✅",
+}
 
 
 def _progress_callback(stage: str, message: str):
     """Pretty-print progress updates."""
-    icons = {
-        "script": "📝",
-        "tts": "🎙️",
-        "audio": "🎵",
-        "subtitles": "💬",
-        "video": "🎬",
-        "done": "✅",
-    }
-    icon = icons.get(stage, "⏳")
-    print(f"  {icon} [{stage}] {message}")
+    icon = _ICONS.get(stage, "⏳")
+    sys.stdout.write(f"  {icon} [{stage}] {message}\n")
+    # Flush every line so progress shows up live when stdout is piped
+    sys.stdout.flush()
 
 
 def cmd_generate(args):
     """Handle the 'generate' subcommand."""
+    from podclaw.generator import PodcastGenerator
+
     # Parse voices
     voices = [v.strip() for v in args.voices.split(",")] if args.voices else ["roger", "george"]
 
     # Parse format
-    try:
-        fmt = Format(args.format)
-    except ValueError:
+    fmt = _FORMAT_MAP.get(args.format)
+    if fmt is None:
         print(f"❌ Unknown format: {args.format}")
-        print(f"   Available: {', '.join(f.value for f in Format)}")
+        print(f"   Available: {_FORMAT_VALUES}")
         sys.exit(1)
 
     # Parse duration
-    duration = _parse_duration(args.duration)
+    try:
+        duration = _parse_duration(args.duration)
+    except ValueError as e:
+        print(f"❌ {e}")
+        sys.exit(1)
 
     # Build config
     config = PodclawConfig(
@@ -76,13 +113,18 @@ def cmd_generate(args):
         output_filename=args.filename,
         show_waveform=not args.no_waveform,
         show_subtitles=not args.no_subtitles,
+        use_tts_cache=not args.no_cache,
+        cache_dir=args.cache_dir,
     )
 
     # Handle custom script
     script = None
     if args.script:
-        with open(args.script, "r") as f:
-            script = f.read()
+        try:
+            script = _read_script(args.script)
+        except ValueError as e:
+            print(f"❌ {e}")
+            sys.exit(1)
 
     print()
     print("🎙️  PodClaw - Podcast Generator")
@@ -141,15 +183,7 @@ def cmd_formats(args):
     """Handle the 'formats' subcommand."""
     print("\n📋 Available Formats")
     print("=" * 60)
-    descriptions = {
-        Format.DEBATE: "Two hosts debate opposing sides of the topic",
-        Format.MONOLOGUE: "Single host deep-dive on the topic",
-        Format.NEWS_RECAP: "Anchor + correspondent news-style coverage",
-        Format.INTERVIEW: "Interviewer + guest conversation",
-        Format.STORYTELLING: "Narrator + color commentary storytelling",
-    }
-    for fmt in Format:
-        print(f"  {fmt.value:<16} {descriptions.get(fmt, '')}")
+    print("\n".join(_FORMAT_ROWS))
     print()
 
 
@@ -216,6 +250,16 @@ Examples:
         action="store_true",
         help="Disable burnt-in subtitles",
     )
+    gen_parser.add_argument(
+        "--cache-dir",
+        default=None,
+        help="Directory for cached TTS segments (default: ~/.cache/podclaw/tts)",
+    )
+    gen_parser.add_argument(
+        "--no-cache",
+        action="store_true",
+        help="Synthesize every segment fresh, without reading or writing the TTS cache",
+    )
     gen_parser.add_argument(
         "--verbose",
         action="store_true",
@@ -6,7 +6,8 @@ from __future__ import annotations
 
 from dataclasses import dataclass, field
 from enum import Enum
-from typing import Dict, List, Optional, Tuple
+from types import MappingProxyType
+from typing import Dict, List, Mapping, Optional, Tuple
 
 
 class Format(str, Enum):
@@ -31,8 +32,13 @@ class Voice:
     use_speaker_boost: bool = True
 
 
-# Built-in voice presets
-VOICES = {
+# Where synthesized segments are cached when PodclawConfig.cache_dir is unset
+DEFAULT_CACHE_DIR = "~/.cache/podclaw/tts"
+
+
+# Built-in voice presets. Read-only, since PodclawConfig memoizes lookups
+# against it; add voices through PodclawConfig.custom_voices instead.
+VOICES: Mapping[str, Voice] = MappingProxyType({
     "roger": Voice(
         name="Roger",
         voice_id="CwhRBWXzGAHq8TQ4Fs17",
@@ -48,7 +54,7 @@ VOICES = {
         voice_id="N2lVS1w4EtoT3dr4eOWO",
         description="Husky trickster male",
     ),
-}
+})
 
 
 @dataclass
@@ -73,6 +79,7 @@ class PodclawConfig:
     text_color: Tuple[int, int, int] = (255, 253, 240)
     show_waveform: bool = True
     show_subtitles: bool = True
+    video_codec: str = "auto"  # Hardware H.264 if available, else libx264
 
     # Subtitle styling
     subtitle_font_size: int = 28
@@ -82,19 +89,42 @@ class PodclawConfig:
     # Output
     output_dir: str = "."
     output_filename: Optional[str] = None
+    work_dir_root: Optional[str] = None  # Default: /dev/shm if usable, else TMPDIR
 
     # TTS
     elevenlabs_api_key: Optional[str] = None
     tts_model: str = "eleven_multilingual_v2"
+    tts_concurrency: int = 4
+    tts_rate_limit_per_min: Optional[int] = None
+    use_tts_cache: bool = True
+    cache_dir: Optional[str] = None  # Defaults to DEFAULT_CACHE_DIR
 
     # Audio
     audio_bitrate: str = "192k"
 
+    # Built-in and raw-ID voices by requested name (see get_voice)
+    _voice_cache: Dict[str, Voice] = field(
+        default_factory=dict, init=False, repr=False, compare=False
+    )
+
     def get_voice(self, name: str) -> Voice:
-        """Resolve a voice name to a Voice object."""
+        """
+        Resolve a voice name to a Voice object.
+
+        custom_voices is checked on every call, so edits to it always take
+        effect; only built-in presets and raw voice IDs are memoized.
+        """
         name_lower = name.lower()
         if name_lower in self.custom_voices:
             return self.custom_voices[name_lower]
+
+        voice = self._voice_cache.get(name)
+        if voice is None:
+            voice = self._voice_cache[name] = self._resolve_voice(name_lower, name)
+        return voice
+
+    @staticmethod
+    def _resolve_voice(name_lower: str, name: str) -> Voice:
         if name_lower in VOICES:
             return VOICES[name_lower]
         # Treat as a raw ElevenLabs voice ID
@@ -2,13 +2,16 @@
 PodClaw core pipeline: orchestrates script → TTS → video generation.
 """
 
+import errno
+import hashlib
 import os
 import shutil
 import tempfile
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from typing import Optional
 
-from podclaw.config import PodclawConfig, Format
+from podclaw.config import DEFAULT_CACHE_DIR, PodclawConfig, Format
 from podclaw.script import (
     generate_prompt,
     parse_script,
@@ -16,8 +19,108 @@ from podclaw.script import (
     generate_demo_script,
 )
 from podclaw.tts import synthesize_all_segments, concatenate_audio, _get_api_key
-from podclaw.subtitles import generate_srt
-from podclaw.video import create_background, assemble_video, get_audio_duration
+from podclaw.subtitles import generate_ass, generate_srt
+from podclaw.video import create_background, assemble_video
+
+
+class _SafeCharTable(dict):
+    """
+    ``str.translate`` table keeping alphanumerics, space, '-' and '_'.
+
+    Entries are filled in on first sight of each codepoint, so the table
+    stays small while translate() does the per-character work in C.
+    """
+
+    def __missing__(self, codepoint: int) -> Optional[int]:
+        ch = chr(codepoint)
+        value = codepoint if ch.isalnum() or ch in " -_" else None
+        self[codepoint] = value
+        return value
+
+
+_SAFE_TABLE = _SafeCharTable()
+
+
+def _default_output_name(topic: str) -> str:
+    """
+    Build the default MP4 filename for a topic.
+
+    The slug is truncated for readability, so a short digest of the full
+    topic keeps episodes whose topics share a prefix from overwriting
+    each other.
+    """
+    slug = topic.translate(_SAFE_TABLE).strip().replace(" ", "_")[:40]
+    digest = hashlib.blake2b(topic.encode("utf-8"), digest_size=4).hexdigest()
+    return f"podclaw_{slug}_{digest}.mp4"
+
+
+# Intermediates for a long episode (per-segment MP3s, combined audio, PNG)
+# stay well under this; below it we fall back to the regular TMPDIR.
+_MIN_TMPFS_FREE_BYTES = 256 * 1024 * 1024
+
+
+def _pick_tmp_root() -> Optional[str]:
+    """Return a RAM-backed temp root (/dev/shm) if usable, else None for TMPDIR."""
+    shm = "/dev/shm"
+    if not os.path.isdir(shm) or not os.access(shm, os.W_OK | os.X_OK):
+        return None
+    try:
+        if shutil.disk_usage(shm).free < _MIN_TMPFS_FREE_BYTES:
+            return None
+    except OSError:
+        return None
+    return shm
+
+
+# Enough for a long episode's MP4, MP3 and PNG; checked before any TTS spend
+_MIN_OUTPUT_FREE_BYTES = 50 * 1024 * 1024
+
+
+def _check_output_dir(output_dir: Path) -> None:
+    """
+    Make sure ``output_dir`` exists, is writable and has room for the episode.
+
+    Raises:
+        ValueError: If any of these fail, before the pipeline spends API quota.
+    """
+    try:
+        output_dir.mkdir(parents=True, exist_ok=True)
+        # Unique name, so concurrent runs don't remove each other's probe
+        fd, probe = tempfile.mkstemp(prefix=".podclaw_probe_", dir=output_dir)
+        os.close(fd)
+        os.unlink(probe)
+    except OSError as e:
+        raise ValueError(f"Output directory is not writable: {output_dir} ({e})") from e
+
+    free = shutil.disk_usage(output_dir).free
+    if free < _MIN_OUTPUT_FREE_BYTES:
+        raise ValueError(
+            f"Not enough free space in {output_dir}: "
+            f"{free // (1024 * 1024)} MB available, "
+            f"{_MIN_OUTPUT_FREE_BYTES // (1024 * 1024)} MB required."
+        )
+
+
+def _tts_cache_dir(config: PodclawConfig) -> Optional[Path]:
+    """Return the TTS cache directory for ``config``, or None if caching is off."""
+    if not config.use_tts_cache:
+        return None
+    return Path(config.cache_dir or DEFAULT_CACHE_DIR).expanduser()
+
+
+def _publish(src: Path, dst: Path) -> None:
+    """
+    Move a finished artifact out of the work directory.
+
+    A rename is O(1) on the same filesystem; across devices (EXDEV) it falls
+    back to a copy, and the work-dir cleanup removes the original.
+    """
+    try:
+        os.replace(src, dst)
+    except OSError as e:
+        if e.errno != errno.EXDEV:
+            raise
+        shutil.copy2(src, dst)
 
 
 class PodcastGenerator:
@@ -32,7 +135,9 @@ class PodcastGenerator:
 
     def __init__(self, config: Optional[PodclawConfig] = None):
         self.config = config or PodclawConfig()
-        self._work_dir = None
+        self._work_dir: Optional[Path] = None
+        self._output_dir: Optional[Path] = None
+        self._executor: Optional[ThreadPoolExecutor] = None
 
     def generate(
         self,
@@ -57,13 +162,26 @@ class PodcastGenerator:
         if not self.config.topic and not script and not self.config.custom_script:
             raise ValueError("Must provide a topic or script.")
 
-        self._work_dir = Path(tempfile.mkdtemp(prefix="podclaw_"))
-        output_dir = Path(self.config.output_dir)
-        output_dir.mkdir(parents=True, exist_ok=True)
+        self._output_dir = Path(self.config.output_dir)
+        _check_output_dir(self._output_dir)
+
+        tmp_root = self.config.work_dir_root or _pick_tmp_root()
+        self._work_dir = Path(tempfile.mkdtemp(prefix="podclaw_", dir=tmp_root))
+
+        # One pool for every stage: TTS requests plus the script write and
+        # background render that run alongside them.
+        self._executor = ThreadPoolExecutor(
+            max_workers=max(4, self.config.tts_concurrency + 1),
+            thread_name_prefix="podclaw",
+        )
 
         try:
-            return self._run_pipeline(script, on_progress)
+            return self._run_pipeline(
+                script, on_progress, self._work_dir, self._output_dir, self._executor
+            )
         finally:
+            self._executor.shutdown(wait=True)
+            self._executor = None
             # Cleanup work directory
             if self._work_dir and self._work_dir.exists():
                 shutil.rmtree(self._work_dir, ignore_errors=True)
@@ -72,8 +190,16 @@ class PodcastGenerator:
         self,
         script: Optional[str],
         on_progress: Optional[callable],
+        work_dir: Path,
+        output_dir: Path,
+        executor: ThreadPoolExecutor,
     ) -> dict:
-        """Execute the full generation pipeline."""
+        """
+        Execute the full generation pipeline.
+
+        The script file and background image do not depend on the audio, so
+        they are written on the shared executor while TTS synthesis is in flight.
+        """
 
         def progress(stage: str, msg: str):
             if on_progress:
@@ -89,9 +215,9 @@ class PodcastGenerator:
         else:
             raw_script = generate_demo_script(self.config)
 
-        # Save script
-        script_path = self._work_dir / "script.txt"
-        script_path.write_text(raw_script, encoding="utf-8")
+        # Save script off the critical path; it's only needed when publishing
+        script_path = work_dir / "script.txt"
+        script_future = executor.submit(script_path.write_bytes, raw_script.encode("utf-8"))
 
         # Parse and assign voices
         segments = parse_script(raw_script)
@@ -105,69 +231,85 @@ class PodcastGenerator:
         progress("tts", "Synthesizing speech...")
 
         api_key = _get_api_key(self.config.elevenlabs_api_key)
-        tts_dir = self._work_dir / "tts"
+        tts_dir = work_dir / "tts"
+        cache_dir = _tts_cache_dir(self.config)
+
+        progress("video", "Creating background...")
+        bg_path = work_dir / "background.png"
+        bg_future = executor.submit(
+            create_background,
+            output_path=bg_path,
+            width=self.config.width,
+            height=self.config.height,
+            bg_color=self.config.background_color,
+            accent_color=self.config.accent_color,
+            text_color=self.config.text_color,
+            title=self.config.topic,
+        )
 
         def tts_progress(current, total, seg):
-            progress("tts", f"Synthesizing segment {current}/{total} [{seg['speaker']}]")
+            progress("tts", f"Synthesized segment {current}/{total} [{seg['speaker']}]")
 
         segments = synthesize_all_segments(
             segments=segments,
             api_key=api_key,
             work_dir=tts_dir,
             on_progress=tts_progress,
+            max_workers=self.config.tts_concurrency,
+            cache_dir=cache_dir,
+            executor=executor,
+            rate_limit_per_min=self.config.tts_rate_limit_per_min,
         )
 
         # Concatenate all audio
         progress("audio", "Concatenating audio...")
         audio_paths = [seg["audio_path"] for seg in segments]
-        combined_audio = self._work_dir / "combined.mp3"
+        combined_audio = work_dir / "combined.mp3"
         combined_audio, timings = concatenate_audio(
             segment_paths=audio_paths,
             output_path=combined_audio,
             gap_ms=400,
+            cache_dir=cache_dir,
         )
         progress("audio", "Audio ready")
 
         # ── Step 3: Subtitles ──────────────────────────────────────────────
         progress("subtitles", "Generating subtitles...")
-        srt_path = self._work_dir / "subtitles.srt"
+        srt_path = work_dir / "subtitles.srt"
         generate_srt(
             segments=segments,
             timings=timings,
             output_path=srt_path,
         )
+        # Pre-styled copy for burn-in; the SRT is what gets published
+        ass_path = None
+        if self.config.show_subtitles:
+            ass_path = generate_ass(
+                segments=segments,
+                timings=timings,
+                output_path=work_dir / "subtitles.ass",
+                font_size=self.config.subtitle_font_size,
+                margin_v=self.config.subtitle_margin_v,
+                outline=self.config.subtitle_outline,
+            )
         progress("subtitles", "Subtitles ready")
 
         # ── Step 4: Background ─────────────────────────────────────────────
-        progress("video", "Creating background...")
-        bg_path = self._work_dir / "background.png"
-        create_background(
-            output_path=bg_path,
-            width=self.config.width,
-            height=self.config.height,
-            bg_color=self.config.background_color,
-            accent_color=self.config.accent_color,
-            text_color=self.config.text_color,
-            title=self.config.topic,
-        )
+        bg_future.result()
         progress("video", "Background ready")
 
         # ── Step 5: Video Assembly ─────────────────────────────────────────
         progress("video", "Assembling final video...")
 
         # Determine output filename
-        if self.config.output_filename:
-            output_name = self.config.output_filename
-        else:
-            safe_topic = "".join(
-                c if c.isalnum() or c in " -_" else ""
-                for c in self.config.topic
-            ).strip().replace(" ", "_")[:50]
-            output_name = f"podclaw_{safe_topic}.mp4"
+        output_name = self.config.output_filename or _default_output_name(self.config.topic)
 
-        output_path = Path(self.config.output_dir) / output_name
+        stem = output_name.removesuffix(".mp4")
+        output_path = output_dir / output_name
 
-        audio_duration = get_audio_duration(str(combined_audio))
+        # The last segment's end is the length of the concatenated track, so
+        # there is no need to probe the combined file again
+        audio_duration = timings[-1]["end_ms"] / 1000
 
         assemble_video(
             background_path=bg_path,
@@ -180,20 +322,23 @@ class PodcastGenerator:
             subtitle_outline=self.config.subtitle_outline,
             audio_bitrate=self.config.audio_bitrate,
             duration=audio_duration + 1,
+            video_codec=self.config.video_codec,
+            ass_path=ass_path,
         )
 
         progress("done", f"Episode complete: {output_path}")
 
         # Copy artifacts to output directory
-        final_audio = Path(self.config.output_dir) / output_name.replace(".mp4", ".mp3")
-        final_srt = Path(self.config.output_dir) / output_name.replace(".mp4", ".srt")
-        final_script = Path(self.config.output_dir) / output_name.replace(".mp4", "_script.txt")
-        final_bg = Path(self.config.output_dir) / output_name.replace(".mp4", "_bg.png")
-
-        shutil.copy2(combined_audio, final_audio)
-        shutil.copy2(srt_path, final_srt)
-        shutil.copy2(script_path, final_script)
-        shutil.copy2(bg_path, final_bg)
+        final_audio = output_dir / f"{stem}.mp3"
+        final_srt = output_dir / f"{stem}.srt"
+        final_script = output_dir / f"{stem}_script.txt"
+        final_bg = output_dir / f"{stem}_bg.png"
+
+        script_future.result()
+        _publish(combined_audio, final_audio)
+        _publish(srt_path, final_srt)
+        _publish(script_path, final_script)
+        _publish(bg_path, final_bg)
 
         return {
             "video": str(output_path),
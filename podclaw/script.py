@@ -5,6 +5,9 @@ Each template produces a structured script with speaker tags
 that the TTS engine uses for voice assignment.
 """
 
+import sys
+from typing import Optional
+
 from podclaw.config import Format, PodclawConfig
 
 
@@ -156,46 +159,56 @@ def generate_prompt(config: PodclawConfig) -> str:
     )
 
 
+def split_speaker_tag(line: str) -> tuple[Optional[str], str]:
+    """
+    Split one script line into its speaker tag and text.
+
+    A speaker tag opens the line (indentation allowed) and the first "]"
+    closes it. Both parts are returned stripped of surrounding whitespace,
+    with a speaker of None if the line has no tag.
+    """
+    line = line.strip()
+    if line.startswith("["):
+        end = line.find("]")
+        if end != -1:
+            return line[1:end].strip(), line[end + 1:].strip()
+    return None, line
+
+
 def parse_script(raw_script: str) -> list[dict]:
     """
     Parse a tagged script into structured segments.
 
+    Text before the first tag, and tags with no speaker or no text, are
+    dropped. Continuation lines are joined with single spaces.
+
     Returns a list of dicts: [{"speaker": "HOST_A", "text": "..."}, ...]
     """
-    segments = []
-    current_speaker = None
-    current_text = []
-
-    for line in raw_script.strip().split("\n"):
-        line = line.strip()
-        if not line:
-            continue
-
-        # Check for speaker tag: [SPEAKER_NAME]
-        if line.startswith("[") and "]" in line:
-            # Flush previous segment
-            if current_speaker and current_text:
-                segments.append({
-                    "speaker": current_speaker,
-                    "text": " ".join(current_text).strip(),
-                })
-                current_text = []
-
-            bracket_end = line.index("]")
-            current_speaker = line[1:bracket_end].strip()
-            remaining = line[bracket_end + 1:].strip()
-            if remaining:
-                current_text.append(remaining)
-        elif current_speaker:
-            current_text.append(line)
-
-    # Flush last segment
-    if current_speaker and current_text:
-        segments.append({
-            "speaker": current_speaker,
-            "text": " ".join(current_text).strip(),
-        })
-
+    # No "[" means no tags; skip the line walk for empty or untagged input
+    if "[" not in raw_script:
+        return []
+
+    segments: list[dict] = []
+    speaker = None
+    lines = []
+
+    def flush():
+        if speaker:
+            text = " ".join(" ".join(lines).split())
+            if text:
+                segments.append({"speaker": speaker, "text": text})
+
+    for line in raw_script.split("\n"):
+        tag, text = split_speaker_tag(line)
+        if tag is not None:
+            flush()
+            # A script repeats a handful of tags; share one string per name
+            speaker = sys.intern(tag)
+            lines = [text]
+        elif speaker is not None:
+            lines.append(text)
+
+    flush()
     return segments
 
 
@@ -204,24 +217,24 @@ def assign_voices(segments: list[dict], config: PodclawConfig) -> list[dict]:
     Assign voice configurations to script segments based on speaker roles.
 
     Maps speakers to voices in order (first unique speaker → first voice, etc.).
+    The "voice" key is set on each segment dict in place, and the same list
+    is returned, so no per-segment copies are made.
     """
+    if not segments:
+        return segments
+
     voices = config.get_all_voices()
     speaker_to_voice = {}
 
     for seg in segments:
         speaker = seg["speaker"]
-        if speaker not in speaker_to_voice:
+        voice = speaker_to_voice.get(speaker)
+        if voice is None:
             voice_index = len(speaker_to_voice) % len(voices)
-            speaker_to_voice[speaker] = voices[voice_index]
-
-    result = []
-    for seg in segments:
-        result.append({
-            **seg,
-            "voice": speaker_to_voice[seg["speaker"]],
-        })
+            voice = speaker_to_voice[speaker] = voices[voice_index]
+        seg["voice"] = voice
 
-    return result
+    return segments
 
 
 def generate_demo_script(config: PodclawConfig) -> str:
@@ -229,7 +242,6 @@ def generate_demo_script(config: PodclawConfig) -> str:
     Generate a demo script without needing an LLM.
     Uses the topic to create a basic but functional script.
     """
-    voices = config.get_all_voices()
     roles = SPEAKER_ROLES.get(config.format, ["HOST_A", "HOST_B"])
 
     if config.format == Format.MONOLOGUE:
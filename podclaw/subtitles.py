@@ -2,15 +2,21 @@
 SRT subtitle generation from timed script segments.
 """
 
+import re
 from pathlib import Path
 
+from podclaw.script import split_speaker_tag
+
+# Cues are written one at a time; a large buffer turns them into a few
+# big writes instead of one syscall per default-sized (8 KiB) block
+_WRITE_BUFFER_BYTES = 64 * 1024
+
 
 def _format_srt_time(ms: int) -> str:
     """Format milliseconds as SRT timestamp: HH:MM:SS,mmm"""
-    hours = ms // 3_600_000
-    minutes = (ms % 3_600_000) // 60_000
-    seconds = (ms % 60_000) // 1_000
-    millis = ms % 1_000
+    seconds, millis = divmod(ms, 1_000)
+    minutes, seconds = divmod(seconds, 60)
+    hours, minutes = divmod(minutes, 60)
     return f"{hours:02d}:{minutes:02d}:{seconds:02d},{millis:03d}"
 
 
@@ -19,26 +25,56 @@ def _split_long_text(text: str, max_chars: int = 80) -> list[str]:
     if len(text) <= max_chars:
         return [text]
 
-    words = text.split()
+    # Pack greedily by jumping to the last space that fits, rather than
+    # walking word by word; whitespace runs are collapsed first.
+    text = " ".join(text.split())
     lines = []
-    current = []
-    current_len = 0
+    start = 0
+    limit = max_chars - 1  # The first chunk stays strictly under max_chars
 
-    for word in words:
-        if current_len + len(word) + 1 > max_chars and current:
-            lines.append(" ".join(current))
-            current = [word]
-            current_len = len(word)
-        else:
-            current.append(word)
-            current_len += len(word) + 1
+    while len(text) - start > limit:
+        cut = text.rfind(" ", start, start + limit + 1)
+        if cut <= start:
+            # A single word longer than the limit gets a chunk to itself
+            cut = text.find(" ", start + 1)
+            if cut == -1:
+                break
+        lines.append(text[start:cut])
+        start = cut + 1
+        limit = max_chars
 
-    if current:
-        lines.append(" ".join(current))
+    if start < len(text):
+        lines.append(text[start:])
 
     return lines
 
 
+def _iter_cues(
+    segments: list[dict],
+    timings: list[dict],
+    max_chars_per_line: int,
+    show_speaker_names: bool,
+):
+    """Yield (start_ms, end_ms, text) for each subtitle cue, in order."""
+    for seg, timing in zip(segments, timings):
+        text = seg["text"]
+        if show_speaker_names:
+            text = f"[{seg['speaker']}] {text}"
+        seg_start = timing["start_ms"]
+        seg_end = timing["end_ms"]
+
+        # Split long segments into subtitle chunks
+        chunks = _split_long_text(text, max_chars_per_line)
+
+        # Distribute timing across chunks; the last one absorbs the remainder
+        ms_per_chunk = (seg_end - seg_start) // max(len(chunks), 1)
+        last = len(chunks) - 1
+
+        for i, chunk in enumerate(chunks):
+            start = seg_start + i * ms_per_chunk
+            yield start, (seg_end if i == last else start + ms_per_chunk), chunk
+
+
 def generate_srt(
     segments: list[dict],
     timings: list[dict],
@@ -62,36 +98,126 @@ def generate_srt(
     output_path = Path(output_path)
     output_path.parent.mkdir(parents=True, exist_ok=True)
 
-    srt_entries = []
-    entry_index = 1
+    cues = _iter_cues(segments, timings, max_chars_per_line, show_speaker_names)
 
-    for seg, timing in zip(segments, timings):
-        text = seg["text"]
-        if show_speaker_names:
-            text = f"[{seg['speaker']}] {text}"
+    # Chunks of one segment are back to back, so a cue usually starts at
+    # the previous cue's end; reuse that timestamp instead of reformatting.
+    prev_end = None
+    end_str = ""
 
-        # Split long segments into subtitle chunks
-        chunks = _split_long_text(text, max_chars_per_line)
+    with open(output_path, "w", encoding="utf-8", buffering=_WRITE_BUFFER_BYTES) as f:
+        for entry_index, (start, end, chunk) in enumerate(cues, 1):
+            start_str = end_str if start == prev_end else _format_srt_time(start)
+            prev_end, end_str = end, _format_srt_time(end)
 
-        # Distribute timing across chunks
-        total_ms = timing["end_ms"] - timing["start_ms"]
-        ms_per_chunk = total_ms // max(len(chunks), 1)
+            # One write per cue; entries are separated by a blank line, with
+            # none after the last
+            sep = "\n" if entry_index > 1 else ""
+            f.write(f"{sep}{entry_index}\n{start_str} --> {end_str}\n{chunk}\n")
 
-        for i, chunk in enumerate(chunks):
-            start = timing["start_ms"] + (i * ms_per_chunk)
-            end = timing["start_ms"] + ((i + 1) * ms_per_chunk)
-            if i == len(chunks) - 1:
-                end = timing["end_ms"]
-
-            srt_entries.append(
-                f"{entry_index}\n"
-                f"{_format_srt_time(start)} --> {_format_srt_time(end)}\n"
-                f"{chunk}\n"
-            )
-            entry_index += 1
+    return output_path
+
+
+def _format_ass_time(ms: int) -> str:
+    """Format milliseconds as ASS timestamp: H:MM:SS.cc"""
+    seconds, centis = divmod((ms + 5) // 10, 100)
+    minutes, seconds = divmod(seconds, 60)
+    hours, minutes = divmod(minutes, 60)
+    return f"{hours}:{minutes:02d}:{seconds:02d}.{centis:02d}"
+
+
+# Same script resolution and base style ffmpeg uses when it converts SRT for
+# the subtitles filter, so sizes and margins render identically.
+_ASS_HEADER = """[Script Info]
+ScriptType: v4.00+
+PlayResX: 384
+PlayResY: 288
+ScaledBorderAndShadow: yes
+YCbCr Matrix: None
+
+[V4+ Styles]
+Format: Name, Fontname, Fontsize, PrimaryColour, SecondaryColour, OutlineColour, \
+BackColour, Bold, Italic, Underline, StrikeOut, ScaleX, ScaleY, Spacing, Angle, \
+BorderStyle, Outline, Shadow, Alignment, MarginL, MarginR, MarginV, Encoding
+Style: Default,Arial,{font_size},&HFFFFFF&,&Hffffff,&H000000&,&H80000000&,1,0,0,0,\
+100,100,0,0,1,{outline},2,2,10,10,{margin_v},1
+
+[Events]
+Format: Layer, Start, End, Style, Name, MarginL, MarginR, MarginV, Effect, Text
+"""
+
+
+# HTML-style markup as ffmpeg's SRT decoder reads it: "<" + tag name, then
+# anything up to ">"
+_HTML_TAG_RE = re.compile(r"<(/?)([a-zA-Z]+)[^<>]*>")
+_ASS_TOGGLE_TAGS = frozenset("ibus")
 
-    with open(output_path, "w", encoding="utf-8") as f:
-        f.write("\n".join(srt_entries))
+
+def _html_tag_to_ass(m: re.Match) -> str:
+    tag = m.group(0)
+    name = m.group(2).lower()
+    if name == "br":
+        return "\\N"
+    if name in _ASS_TOGGLE_TAGS and not tag.endswith("/>"):
+        return f"{{\\{name}{0 if m.group(1) else 1}}}"
+    return ""
+
+
+def _html_to_ass(text: str) -> str:
+    """
+    Convert SRT markup to ASS override tags the way ffmpeg does.
+
+    <i>, <b>, <u>, <s> become {\\i1}...{\\i0} etc. and <br> becomes \\N.
+    Other tags, <font> included, are dropped rather than translated.
+    """
+    if "<" not in text:
+        return text
+    return _HTML_TAG_RE.sub(_html_tag_to_ass, text)
+
+
+def generate_ass(
+    segments: list[dict],
+    timings: list[dict],
+    output_path: Path,
+    max_chars_per_line: int = 80,
+    show_speaker_names: bool = False,
+    font_size: int = 28,
+    margin_v: int = 60,
+    outline: int = 3,
+) -> Path:
+    """
+    Generate an ASS subtitle file with the burn-in style baked in.
+
+    Takes the same cues as :func:`generate_srt`. Burning this in skips the
+    SRT-to-ASS conversion and force_style pass ffmpeg does for an SRT.
+    Italic, bold, underline, strikeout and <br> markup is converted as
+    ffmpeg would; <font> styling is not reproduced.
+
+    Args:
+        segments: List of {"speaker", "text", ...} dicts.
+        timings: List of {"start_ms", "end_ms"} dicts (parallel to segments).
+        output_path: Where to save the .ass file.
+        max_chars_per_line: Maximum characters per subtitle line.
+        show_speaker_names: Whether to prefix lines with speaker names.
+        font_size: Font size for subtitles.
+        margin_v: Vertical margin for subtitles.
+        outline: Outline width for subtitles.
+
+    Returns:
+        Path to the generated ASS file.
+    """
+    output_path = Path(output_path)
+    output_path.parent.mkdir(parents=True, exist_ok=True)
+
+    cues = _iter_cues(segments, timings, max_chars_per_line, show_speaker_names)
+
+    with open(output_path, "w", encoding="utf-8", buffering=_WRITE_BUFFER_BYTES) as f:
+        f.write(_ASS_HEADER.format(font_size=font_size, margin_v=margin_v, outline=outline))
+        for start, end, chunk in cues:
+            f.write(
+                f"Dialogue: 0,{_format_ass_time(start)},{_format_ass_time(end)},"
+                f"Default,,0,0,0,,{_html_to_ass(chunk)}\n"
+            )
 
     return output_path
 
@@ -108,42 +234,39 @@ def generate_srt_from_text(
     output_path = Path(output_path)
     output_path.parent.mkdir(parents=True, exist_ok=True)
 
-    sentences = []
-    for line in full_text.strip().split("\n"):
-        line = line.strip()
-        if not line:
-            continue
-        # Strip speaker tags for subtitle display
-        if line.startswith("[") and "]" in line:
-            line = line[line.index("]") + 1:].strip()
-        if line:
-            sentences.append(line)
+    # Strip speaker tags for subtitle display, using the parser's tag rule
+    lines = map(split_speaker_tag, full_text.split("\n"))
+    sentences = [text for _, text in lines if text]
 
     if not sentences:
         output_path.write_text("")
         return output_path
 
     ms_per_sentence = total_duration_ms // len(sentences)
-    entries = []
-
-    for i, sentence in enumerate(sentences):
-        start = i * ms_per_sentence
-        end = (i + 1) * ms_per_sentence - 100  # Small gap
-        chunks = _split_long_text(sentence)
-
-        for j, chunk in enumerate(chunks):
-            chunk_start = start + j * (ms_per_sentence // max(len(chunks), 1))
-            chunk_end = start + (j + 1) * (ms_per_sentence // max(len(chunks), 1))
-            if j == len(chunks) - 1:
-                chunk_end = end
-
-            entries.append(
-                f"{len(entries) + 1}\n"
-                f"{_format_srt_time(chunk_start)} --> {_format_srt_time(chunk_end)}\n"
-                f"{chunk}\n"
-            )
+    entry_index = 1
+    prev_end = None
+    end_str = ""
+
+    with open(output_path, "w", encoding="utf-8", buffering=_WRITE_BUFFER_BYTES) as f:
+        for i, sentence in enumerate(sentences):
+            start = i * ms_per_sentence
+            end = (i + 1) * ms_per_sentence - 100  # Small gap
+            chunks = _split_long_text(sentence)
+
+            for j, chunk in enumerate(chunks):
+                chunk_start = start + j * (ms_per_sentence // max(len(chunks), 1))
+                chunk_end = start + (j + 1) * (ms_per_sentence // max(len(chunks), 1))
+                if j == len(chunks) - 1:
+                    chunk_end = end
+
+                if chunk_start == prev_end:
+                    start_str = end_str
+                else:
+                    start_str = _format_srt_time(chunk_start)
+                prev_end, end_str = chunk_end, _format_srt_time(chunk_end)
 
-    with open(output_path, "w", encoding="utf-8") as f:
-        f.write("\n".join(entries))
+                sep = "\n" if entry_index > 1 else ""
+                f.write(f"{sep}{entry_index}\n{start_str} --> {end_str}\n{chunk}\n")
+                entry_index += 1
 
     return output_path
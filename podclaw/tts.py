@@ -4,13 +4,18 @@ Text-to-speech synthesis via ElevenLabs API.
 Handles voice synthesis, audio concatenation, and timing extraction.
 """
 
+import hashlib
 import io
 import os
+import shutil
 import struct
 import tempfile
+import threading
+import time
 import wave
+from concurrent.futures import FIRST_COMPLETED, Executor, Future, ThreadPoolExecutor, wait
 from pathlib import Path
-from typing import Optional
+from typing import Optional, cast
 
 from podclaw.config import Voice
 
@@ -26,6 +31,35 @@ def _get_api_key(config_key: Optional[str] = None) -> str:
     return key
 
 
+# Upper bound on pooled keep-alive connections to api.elevenlabs.io
+_HTTP_POOL_SIZE = 32
+
+# Read size when streaming TTS audio to disk
+_STREAM_CHUNK_BYTES = 64 * 1024
+
+_session = None
+_session_lock = threading.Lock()
+
+
+def _get_session():
+    """
+    Return the process-wide HTTP session for ElevenLabs requests.
+
+    Reusing one session keeps TLS connections alive across segments (and
+    across TTS worker threads) instead of handshaking for every request.
+    """
+    global _session
+    with _session_lock:
+        if _session is None:
+            import requests
+            from requests.adapters import HTTPAdapter
+
+            session = requests.Session()
+            session.mount("https://", HTTPAdapter(pool_maxsize=_HTTP_POOL_SIZE))
+            _session = session
+    return _session
+
+
 def synthesize_segment(
     text: str,
     voice: Voice,
@@ -39,13 +73,12 @@ def synthesize_segment(
         text: The text to synthesize.
         voice: Voice configuration.
         api_key: ElevenLabs API key.
-        output_path: Where to save the MP3 file.
+        output_path: Where to save the MP3 file. Its directory must exist;
+            ``synthesize_all_segments`` creates it once for the batch.
 
     Returns:
         Path to the generated MP3 file.
     """
-    import requests
-
     url = f"https://api.elevenlabs.io/v1/text-to-speech/{voice.voice_id}"
 
     headers = {
@@ -65,30 +98,164 @@ def synthesize_segment(
         },
     }
 
-    response = requests.post(url, json=payload, headers=headers, timeout=120)
-    response.raise_for_status()
+    # Stream the body to disk rather than holding the whole MP3 in memory
+    with _get_session().post(
+        url, json=payload, headers=headers, timeout=120, stream=True
+    ) as response:
+        response.raise_for_status()
 
-    output_path.parent.mkdir(parents=True, exist_ok=True)
-    with open(output_path, "wb") as f:
-        f.write(response.content)
+        with open(output_path, "wb") as f:
+            for chunk in response.iter_content(chunk_size=_STREAM_CHUNK_BYTES):
+                f.write(chunk)
 
     return output_path
 
 
+class _RateLimiter:
+    """Token bucket allowing ``rate_per_min`` requests per minute, shared by threads."""
+
+    def __init__(self, rate_per_min: int, burst: int = 1):
+        if rate_per_min <= 0:
+            raise ValueError(
+                f"TTS rate limit must be a positive number of requests per minute, "
+                f"got {rate_per_min}"
+            )
+        self._interval = 60.0 / rate_per_min
+        # A burst larger than one minute's quota would overshoot the cap
+        self._capacity = float(max(1, min(burst, rate_per_min)))
+        self._tokens = self._capacity
+        self._last = time.monotonic()
+        self._lock = threading.Lock()
+
+    def acquire(self) -> None:
+        """Block until a request may be sent."""
+        with self._lock:
+            now = time.monotonic()
+            elapsed = (now - self._last) / self._interval
+            self._tokens = min(self._capacity, self._tokens + elapsed)
+            self._last = now
+            # Reserve a token now (possibly going negative) and sleep it off
+            # outside the lock so waiting threads queue up in order.
+            self._tokens -= 1
+            delay = -self._tokens * self._interval if self._tokens < 0 else 0.0
+        if delay:
+            time.sleep(delay)
+
+
+def _voice_fingerprint(voice: Voice) -> bytes:
+    """Serialize every voice setting that affects the synthesized audio."""
+    parts = (
+        voice.voice_id,
+        voice.model_id,
+        voice.stability,
+        voice.similarity_boost,
+        voice.style,
+        voice.use_speaker_boost,
+    )
+    return b"".join(str(part).encode("utf-8") + b"\0" for part in parts)
+
+
+def _cache_key(text: str, voice: Voice, fingerprint: Optional[bytes] = None) -> str:
+    """Content hash of the voice settings and text."""
+    h = hashlib.blake2b(fingerprint or _voice_fingerprint(voice), digest_size=20)
+    h.update(text.encode("utf-8") + b"\0")
+    return h.hexdigest()
+
+
+def _link_or_copy(src: Path, dst: Path) -> None:
+    """Hardlink ``src`` to ``dst``, copying when linking isn't possible."""
+    try:
+        os.link(src, dst)
+    except OSError:
+        shutil.copyfile(src, dst)
+
+
+def _store_in_cache(audio_path: Path, cached_path: Path) -> None:
+    """Atomically add a synthesized file to the cache. Failures are ignored."""
+    try:
+        fd, tmp = tempfile.mkstemp(dir=cached_path.parent, suffix=".tmp")
+    except OSError:
+        return
+    os.close(fd)
+    try:
+        shutil.copyfile(audio_path, tmp)
+        os.replace(tmp, cached_path)
+    except OSError:
+        Path(tmp).unlink(missing_ok=True)
+
+
+def _segment_path(work_dir: Path, index: int) -> Path:
+    return work_dir / f"segment_{index:04d}.mp3"
+
+
+def _synthesize_one(
+    index: int,
+    seg: dict,
+    key: str,
+    api_key: str,
+    work_dir: Path,
+    cache_dir: Optional[Path] = None,
+    limiter: Optional[_RateLimiter] = None,
+) -> dict:
+    """Synthesize segment ``index`` into ``work_dir`` and return it with "audio_path"."""
+    audio_path = _segment_path(work_dir, index)
+
+    cached_path = None
+    if cache_dir is not None:
+        cached_path = cache_dir / f"{key}.mp3"
+        if cached_path.exists():
+            _link_or_copy(cached_path, audio_path)
+            return {**seg, "audio_path": str(audio_path)}
+
+    if limiter is not None:
+        limiter.acquire()
+
+    synthesize_segment(
+        text=seg["text"],
+        voice=seg["voice"],
+        api_key=api_key,
+        output_path=audio_path,
+    )
+
+    if cached_path is not None:
+        _store_in_cache(audio_path, cached_path)
+
+    return {**seg, "audio_path": str(audio_path)}
+
+
 def synthesize_all_segments(
     segments: list[dict],
     api_key: str,
     work_dir: Path,
     on_progress: Optional[callable] = None,
+    max_workers: int = 4,
+    cache_dir: Optional[Path] = None,
+    executor: Optional[Executor] = None,
+    rate_limit_per_min: Optional[int] = None,
 ) -> list[dict]:
     """
     Synthesize all script segments to individual audio files.
 
+    Segments are synthesized concurrently (TTS is network-bound), but results
+    and progress callbacks are always delivered in script order. Repeated
+    lines with identical voice settings are synthesized once and linked.
+
     Args:
         segments: List of {"speaker", "text", "voice"} dicts.
         api_key: ElevenLabs API key.
         work_dir: Working directory for temporary files.
-        on_progress: Optional callback(current, total, segment).
+        on_progress: Optional callback(current, total, segment), called in
+            order as each segment finishes.
+        max_workers: Maximum number of concurrent TTS requests.
+        cache_dir: Optional directory of previously synthesized segments,
+            keyed by a hash of the text and voice settings. Hits skip the
+            ElevenLabs request entirely.
+        executor: Optional executor to run requests on (e.g. one shared with
+            other pipeline stages). A private thread pool is used otherwise.
+        rate_limit_per_min: Optional cap on ElevenLabs requests per minute,
+            to stay under the account's limit instead of hitting 429s.
+            Cache hits and deduplicated lines don't count. Must be positive;
+            at most this many requests go out back to back.
 
     Returns:
         Segments with added "audio_path" key.
@@ -96,38 +263,149 @@ def synthesize_all_segments(
     work_dir = Path(work_dir)
     work_dir.mkdir(parents=True, exist_ok=True)
 
-    results = []
+    if cache_dir is not None:
+        cache_dir = Path(cache_dir)
+        try:
+            cache_dir.mkdir(parents=True, exist_ok=True)
+        except OSError:
+            cache_dir = None
+
+    total = len(segments)
+    results: list[Optional[dict]] = [None] * total
+    cursor = 0
+
+    # Only the first occurrence of each (voice settings, text) is synthesized.
+    # Segments share a handful of Voice objects, so serialize each one once.
+    fingerprints: dict[int, bytes] = {}
+    first_by_key: dict[str, int] = {}
+    duplicates: dict[int, list[int]] = {}
     for i, seg in enumerate(segments):
-        audio_path = work_dir / f"segment_{i:04d}.mp3"
+        voice = seg["voice"]
+        fingerprint = fingerprints.get(id(voice))
+        if fingerprint is None:
+            fingerprint = fingerprints[id(voice)] = _voice_fingerprint(voice)
+        key = _cache_key(seg["text"], voice, fingerprint)
+        first = first_by_key.setdefault(key, i)
+        if first != i:
+            duplicates.setdefault(first, []).append(i)
+
+    limiter = None
+    if rate_limit_per_min is not None:
+        limiter = _RateLimiter(rate_limit_per_min, burst=max_workers)
+
+    owns_executor = executor is None
+    pool: Executor = executor or ThreadPoolExecutor(max_workers=max(1, max_workers))
+
+    # Keep at most max_workers requests in flight, even on a shared executor
+    jobs = iter(first_by_key.items())
+    pending: dict[Future, int] = {}
+
+    def submit_next() -> None:
+        for key, i in jobs:
+            future = pool.submit(
+                _synthesize_one, i, segments[i], key, api_key, work_dir, cache_dir, limiter
+            )
+            pending[future] = i
+            return
+
+    try:
+        for _ in range(max(1, max_workers)):
+            submit_next()
+
+        while pending:
+            done, _ = wait(pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                i = pending.pop(future)
+                result = results[i] = future.result()
+                for dup in duplicates.get(i, ()):
+                    dup_path = _segment_path(work_dir, dup)
+                    _link_or_copy(Path(result["audio_path"]), dup_path)
+                    results[dup] = {**segments[dup], "audio_path": str(dup_path)}
+                submit_next()
+
+            # Segments finish out of order; only report the contiguous prefix
+            while cursor < total and results[cursor] is not None:
+                if on_progress:
+                    on_progress(cursor + 1, total, segments[cursor])
+                cursor += 1
+    except BaseException:
+        for future in pending:
+            future.cancel()
+        raise
+    finally:
+        if owns_executor:
+            pool.shutdown(wait=True)
+
+    # Every slot is filled once nothing is pending
+    return cast("list[dict]", results)
+
+
+def _make_silence(output_path: Path, gap_ms: int) -> None:
+    """Encode ``gap_ms`` of silence in the same format ElevenLabs returns (44.1 kHz mono MP3)."""
+    import subprocess
 
-        if on_progress:
-            on_progress(i + 1, len(segments), seg)
+    subprocess.run(
+        [
+            "ffmpeg", "-y",
+            "-f", "lavfi",
+            "-i", f"anullsrc=channel_layout=mono:sample_rate=44100:duration={gap_ms/1000}",
+            "-c:a", "libmp3lame",
+            "-b:a", "192k",
+            "-f", "mp3",
+            str(output_path),
+        ],
+        capture_output=True,
+        check=True,
+    )
 
-        synthesize_segment(
-            text=seg["text"],
-            voice=seg["voice"],
-            api_key=api_key,
-            output_path=audio_path,
-        )
 
-        results.append({**seg, "audio_path": str(audio_path)})
+def _get_silence(gap_ms: int, temp_path: Path, cache_dir: Optional[Path]) -> Path:
+    """
+    Return a silence MP3 of ``gap_ms``.
 
-    return results
+    Uses (or fills) ``cache_dir`` when given; otherwise, or if the cache is
+    unwritable, encodes to ``temp_path``.
+    """
+    if cache_dir is not None:
+        cached_path = Path(cache_dir) / f"silence_{gap_ms}.mp3"
+        if cached_path.exists():
+            return cached_path
+        try:
+            cached_path.parent.mkdir(parents=True, exist_ok=True)
+            fd, tmp = tempfile.mkstemp(dir=cached_path.parent, suffix=".tmp")
+            os.close(fd)
+        except OSError:
+            pass
+        else:
+            try:
+                _make_silence(Path(tmp), gap_ms)
+                os.replace(tmp, cached_path)
+                return cached_path
+            finally:
+                Path(tmp).unlink(missing_ok=True)
+
+    _make_silence(temp_path, gap_ms)
+    return temp_path
 
 
 def concatenate_audio(
     segment_paths: list[str],
     output_path: Path,
     gap_ms: int = 300,
+    cache_dir: Optional[Path] = None,
 ) -> tuple[Path, list[dict]]:
     """
     Concatenate audio segments into a single file with gaps between segments.
-    Uses ffmpeg for reliable MP3 handling.
+
+    Segments are joined with ffmpeg's concat demuxer in stream-copy mode, so
+    the MP3 frames are not decoded or re-encoded.
 
     Args:
         segment_paths: List of paths to MP3 files.
         output_path: Where to save the concatenated audio.
         gap_ms: Milliseconds of silence between segments.
+        cache_dir: Optional directory to keep the silence file in, so it is
+            only encoded once per gap length.
 
     Returns:
         Tuple of (output_path, timing_info) where timing_info is a list of
@@ -138,7 +416,15 @@ def concatenate_audio(
     output_path = Path(output_path)
     output_path.parent.mkdir(parents=True, exist_ok=True)
 
-    # Get durations of each segment via ffprobe
+    temp_silence = output_path.parent / "_silence.mp3"
+    silence_path = None
+    if len(segment_paths) > 1:
+        silence_path = _get_silence(gap_ms, temp_silence, cache_dir)
+        # MP3 frames don't divide gap_ms evenly; time gaps by what's actually
+        # spliced in so subtitles don't drift over a long episode.
+        gap_ms = _get_duration_ms(str(silence_path))
+
+    # Get durations of each segment
     timings = []
     current_ms = 0
 
@@ -151,29 +437,17 @@ def concatenate_audio(
         })
         current_ms += duration_ms + gap_ms
 
-    # Build ffmpeg concat filter
-    # Create silence file
-    silence_path = output_path.parent / "_silence.mp3"
-    subprocess.run(
-        [
-            "ffmpeg", "-y",
-            "-f", "lavfi",
-            "-i", f"anullsrc=channel_layout=mono:sample_rate=44100:duration={gap_ms/1000}",
-            "-c:a", "libmp3lame",
-            "-b:a", "192k",
-            str(silence_path),
-        ],
-        capture_output=True,
-        check=True,
-    )
+    def entry(path) -> str:
+        escaped = str(path).replace("'", "'\\''")
+        return f"file '{escaped}'\n"
 
     # Build concat list file
     list_path = output_path.parent / "_concat_list.txt"
     with open(list_path, "w") as f:
         for i, path in enumerate(segment_paths):
-            f.write(f"file '{path}'\n")
+            f.write(entry(path))
             if i < len(segment_paths) - 1:
-                f.write(f"file '{silence_path}'\n")
+                f.write(entry(silence_path))
 
     # Concatenate
     subprocess.run(
@@ -182,8 +456,7 @@ def concatenate_audio(
             "-f", "concat",
             "-safe", "0",
             "-i", str(list_path),
-            "-c:a", "libmp3lame",
-            "-b:a", "192k",
+            "-c", "copy",
             str(output_path),
         ],
         capture_output=True,
@@ -191,13 +464,100 @@ def concatenate_audio(
     )
 
     # Cleanup temp files
-    silence_path.unlink(missing_ok=True)
+    temp_silence.unlink(missing_ok=True)
     list_path.unlink(missing_ok=True)
 
     return output_path, timings
 
 
 def _get_duration_ms(audio_path: str) -> int:
+    """Get audio duration in milliseconds, parsing MP3 frames before trying ffprobe."""
+    duration_ms = _mp3_duration_ms(audio_path)
+    if duration_ms is not None:
+        return duration_ms
+    return _ffprobe_duration_ms(audio_path)
+
+
+# MPEG audio Layer III header tables, indexed by the header's bit fields.
+# Version bits: 0 = MPEG 2.5, 2 = MPEG 2, 3 = MPEG 1 (1 is reserved).
+_MP3_BITRATES_KBPS = {
+    3: (0, 32, 40, 48, 56, 64, 80, 96, 112, 128, 160, 192, 224, 256, 320, 0),
+    2: (0, 8, 16, 24, 32, 40, 48, 56, 64, 80, 96, 112, 128, 144, 160, 0),
+}
+_MP3_BITRATES_KBPS[0] = _MP3_BITRATES_KBPS[2]
+_MP3_SAMPLE_RATES = {
+    3: (44100, 48000, 32000),
+    2: (22050, 24000, 16000),
+    0: (11025, 12000, 8000),
+}
+
+
+def _mp3_duration_ms(audio_path: str) -> Optional[int]:
+    """
+    Compute an MP3's duration by walking its frame headers.
+
+    Avoids an ffprobe process per segment. Returns None for anything that
+    isn't a clean MPEG Layer III stream so the caller can fall back.
+    """
+    try:
+        data = Path(audio_path).read_bytes()
+    except OSError:
+        return None
+
+    pos = 0
+    # Skip an ID3v2 tag (10-byte header, syncsafe size, optional footer)
+    if data[:3] == b"ID3" and len(data) >= 10:
+        size = (data[6] << 21) | (data[7] << 14) | (data[8] << 7) | data[9]
+        pos = 10 + size + (10 if data[5] & 0x10 else 0)
+
+    end = len(data)
+    if data[-128:-125] == b"TAG":  # ID3v1 trailer
+        end -= 128
+
+    frames = 0
+    duration_s = 0.0
+    first = True
+    while pos + 4 <= end:
+        b1, b2, b3 = data[pos + 1], data[pos + 2], data[pos + 3]
+        if data[pos] != 0xFF or (b1 & 0xE0) != 0xE0:
+            return None
+        version = (b1 >> 3) & 0x03
+        layer = (b1 >> 1) & 0x03
+        bitrate_index = b2 >> 4
+        rate_index = (b2 >> 2) & 0x03
+        if version == 1 or layer != 1 or rate_index == 3:
+            return None
+        bitrate = _MP3_BITRATES_KBPS[version][bitrate_index] * 1000
+        if not bitrate:
+            return None
+        sample_rate = _MP3_SAMPLE_RATES[version][rate_index]
+        padding = (b2 >> 1) & 0x01
+        frame_samples = 1152 if version == 3 else 576
+        frame_len = frame_samples // 8 * bitrate // sample_rate + padding
+
+        # A leading Xing/Info frame carries metadata, not audio
+        if not (first and _is_xing_frame(data, pos, version, b3)):
+            frames += 1
+            duration_s += frame_samples / sample_rate
+        first = False
+        pos += frame_len
+
+    if not frames:
+        return None
+    return int(duration_s * 1000)
+
+
+def _is_xing_frame(data: bytes, pos: int, version: int, b3: int) -> bool:
+    mono = (b3 >> 6) == 0x03
+    if version == 3:
+        side_info = 17 if mono else 32
+    else:
+        side_info = 9 if mono else 17
+    tag = data[pos + 4 + side_info:pos + 8 + side_info]
+    return tag in (b"Xing", b"Info")
+
+
+def _ffprobe_duration_ms(audio_path: str) -> int:
     """Get audio duration in milliseconds using ffprobe."""
     import subprocess
 
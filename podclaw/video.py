@@ -4,11 +4,70 @@ Video assembly: background generation + ffmpeg composition.
 Creates the final MP4 from background image, audio, waveform, and subtitles.
 """
 
+import functools
+import math
 import subprocess
 from pathlib import Path
 from typing import Optional
 
 
+# Unit (cos, sin, radius) for the 8 points of a decorative star, tip first
+_STAR_POINTS = tuple(
+    (
+        math.cos(math.radians(i * 45 - 90)),
+        math.sin(math.radians(i * 45 - 90)),
+        1.0 if i % 2 == 0 else 0.4,
+    )
+    for i in range(8)
+)
+
+
+def _font_candidates(bold: bool) -> list[str]:
+    """TrueType paths to try, in order, for the title/body fonts."""
+    return [
+        # macOS
+        "/System/Library/Fonts/Supplemental/Georgia Bold.ttf" if bold
+        else "/System/Library/Fonts/Supplemental/Georgia.ttf",
+        "/System/Library/Fonts/Supplemental/Arial Bold.ttf" if bold
+        else "/System/Library/Fonts/Supplemental/Arial.ttf",
+        # Linux
+        "/usr/share/fonts/truetype/dejavu/DejaVuSans-Bold.ttf" if bold
+        else "/usr/share/fonts/truetype/dejavu/DejaVuSans.ttf",
+        "/usr/share/fonts/truetype/liberation/LiberationSans-Bold.ttf" if bold
+        else "/usr/share/fonts/truetype/liberation/LiberationSans-Regular.ttf",
+    ]
+
+
+@functools.cache
+def _resolve_font_path(bold: bool) -> Optional[str]:
+    """Return the first loadable font for the weight, or None if none are."""
+    from PIL import ImageFont
+
+    for path in _font_candidates(bold):
+        try:
+            ImageFont.truetype(path, 12)
+        except (OSError, IOError):
+            continue
+        return path
+    return None
+
+
+@functools.lru_cache(maxsize=32)
+def _load_font(size: int, bold: bool = False):
+    """
+    Load a font with cross-platform fallback.
+
+    Fonts are cached per (size, bold), so repeated renders in one process
+    parse each TrueType file once.
+    """
+    from PIL import ImageFont
+
+    path = _resolve_font_path(bold)
+    if path is None:
+        return ImageFont.load_default()
+    return ImageFont.truetype(path, size)
+
+
 def create_background(
     output_path: Path,
     width: int = 1920,
@@ -35,21 +94,21 @@ def create_background(
     Returns:
         Path to the generated image.
     """
-    from PIL import Image, ImageDraw, ImageFont
-    import math
+    from PIL import Image, ImageDraw
 
     output_path = Path(output_path)
     output_path.parent.mkdir(parents=True, exist_ok=True)
 
-    img = Image.new("RGB", (width, height), bg_color)
+    # Gradient background: build one pixel column, then stretch it across
+    # the frame in C instead of drawing every row from Python
+    column = bytes(
+        int(c * (1.0 - (y / height) * 0.2)) for y in range(height) for c in bg_color
+    )
+    # Image.Resampling only exists from Pillow 9.1; 9.0 has the bare constant
+    nearest = getattr(Image, "Resampling", Image).NEAREST
+    img = Image.frombytes("RGB", (1, height), column).resize((width, height), nearest)
     draw = ImageDraw.Draw(img)
 
-    # Gradient background
-    for y in range(height):
-        factor = 1.0 - (y / height) * 0.2
-        color = tuple(int(c * factor) for c in bg_color)
-        draw.line([(0, y), (width, y)], fill=color)
-
     # Decorative border
     margin = 45
     draw.rectangle(
@@ -80,10 +139,9 @@ def create_background(
     # Side decorative stars
     def draw_star(cx, cy, size=12):
         points = []
-        for i in range(8):
-            angle = math.radians(i * 45 - 90)
-            r = size if i % 2 == 0 else size * 0.4
-            points.append((cx + r * math.cos(angle), cy + r * math.sin(angle)))
+        for cos_a, sin_a, radius in _STAR_POINTS:
+            r = size * radius
+            points.append((cx + r * cos_a, cy + r * sin_a))
         draw.polygon(points, fill=accent_color)
 
     star_positions = [
@@ -94,30 +152,9 @@ def create_background(
     for sx, sy in star_positions:
         draw_star(sx, sy)
 
-    # Load fonts with cross-platform fallback
-    def load_font(size: int, bold: bool = False):
-        font_candidates = [
-            # macOS
-            "/System/Library/Fonts/Supplemental/Georgia Bold.ttf" if bold
-            else "/System/Library/Fonts/Supplemental/Georgia.ttf",
-            "/System/Library/Fonts/Supplemental/Arial Bold.ttf" if bold
-            else "/System/Library/Fonts/Supplemental/Arial.ttf",
-            # Linux
-            "/usr/share/fonts/truetype/dejavu/DejaVuSans-Bold.ttf" if bold
-            else "/usr/share/fonts/truetype/dejavu/DejaVuSans.ttf",
-            "/usr/share/fonts/truetype/liberation/LiberationSans-Bold.ttf" if bold
-            else "/usr/share/fonts/truetype/liberation/LiberationSans-Regular.ttf",
-        ]
-        for path in font_candidates:
-            try:
-                return ImageFont.truetype(path, size)
-            except (OSError, IOError):
-                continue
-        return ImageFont.load_default()
-
     # Title
     if title:
-        font_title = load_font(64, bold=True)
+        font_title = _load_font(64, bold=True)
         bbox = draw.textbbox((0, 0), title, font=font_title)
         tw = bbox[2] - bbox[0]
         tx = (width - tw) // 2
@@ -128,7 +165,7 @@ def create_background(
 
     # Subtitle
     if subtitle:
-        font_sub = load_font(36)
+        font_sub = _load_font(36)
         bbox = draw.textbbox((0, 0), subtitle, font=font_sub)
         sw = bbox[2] - bbox[0]
         sx = (width - sw) // 2
@@ -136,7 +173,7 @@ def create_background(
         draw.text((sx, sy), subtitle, font=font_sub, fill=accent_color)
 
     # "Generated with PodClaw" watermark (subtle)
-    font_wm = load_font(22)
+    font_wm = _load_font(22)
     wm_text = "Generated with PodClaw"
     bbox = draw.textbbox((0, 0), wm_text, font=font_wm)
     ww = bbox[2] - bbox[0]
@@ -151,6 +188,74 @@ def create_background(
     return output_path
 
 
+# Hardware H.264 encoders tried by video_codec="auto", in preference order,
+# with the rate-control flags each one needs. VAAPI is left out because it
+# needs a device and an explicit hwupload in the filtergraph.
+_HW_ENCODERS = {
+    "h264_videotoolbox": ["-q:v", "60"],
+    "h264_nvenc": ["-preset", "p1", "-tune", "ll", "-rc", "constqp", "-qp", "23"],
+    "h264_qsv": ["-global_quality", "23"],
+}
+_ENCODER_ARGS = {"libx264": ["-tune", "stillimage"], **_HW_ENCODERS}
+
+# Frame rates for a waveform-free video: fully static, or with subtitles
+# (fast enough that cues appear within 100 ms of their timestamps)
+_STATIC_FPS = 2
+_SUBTITLE_FPS = 10
+
+# Encoders that are compiled in but failed at runtime (e.g. no GPU present)
+_failed_encoders: set[str] = set()
+
+# ffmpeg stderr fragments meaning the encoder itself could not start, as
+# opposed to a problem with the inputs, filters or output
+_ENCODER_INIT_ERRORS = (
+    "Error while opening encoder",
+    "Encoder not found",
+    "Cannot load",
+    "No capable devices found",
+    "OpenEncodeSessionEx failed",
+    "MFX session",
+    "cannot create compression session",
+)
+
+
+def _is_encoder_init_error(stderr: str) -> bool:
+    return any(fragment in stderr for fragment in _ENCODER_INIT_ERRORS)
+
+
+@functools.cache
+def _available_encoders() -> frozenset[str]:
+    """Names of the video encoders this ffmpeg build was compiled with."""
+    try:
+        result = subprocess.run(
+            ["ffmpeg", "-hide_banner", "-encoders"],
+            capture_output=True,
+            text=True,
+            check=True,
+        )
+    except (OSError, subprocess.CalledProcessError):
+        return frozenset()
+
+    names = set()
+    for line in result.stdout.splitlines():
+        parts = line.split()
+        # Encoder rows look like " V....D libx264   description"
+        if len(parts) >= 2 and parts[0].startswith("V"):
+            names.add(parts[1])
+    return frozenset(names)
+
+
+def _resolve_video_codec(video_codec: str) -> str:
+    """Map "auto" to the first usable hardware encoder, else libx264."""
+    if video_codec != "auto":
+        return video_codec
+    available = _available_encoders()
+    for name in _HW_ENCODERS:
+        if name in available and name not in _failed_encoders:
+            return name
+    return "libx264"
+
+
 def assemble_video(
     background_path: Path,
     audio_path: Path,
@@ -162,6 +267,8 @@ def assemble_video(
     subtitle_outline: int = 3,
     audio_bitrate: str = "192k",
     duration: Optional[float] = None,
+    video_codec: str = "auto",
+    ass_path: Optional[Path] = None,
 ) -> Path:
     """
     Assemble the final video using ffmpeg.
@@ -183,6 +290,10 @@ def assemble_video(
         subtitle_outline: Outline width for subtitles.
         audio_bitrate: Audio encoding bitrate.
         duration: Optional duration limit in seconds.
+        video_codec: ffmpeg video encoder, or "auto" to use a hardware H.264
+            encoder when one works and fall back to libx264 otherwise.
+        ass_path: Optional pre-styled ASS subtitle file (see
+            ``generate_ass``); burned in instead of ``srt_path`` when given.
 
     Returns:
         Path to the generated MP4.
@@ -193,7 +304,8 @@ def assemble_video(
     # Build filter chain
     filters = []
 
-    has_subtitles = srt_path and srt_path.exists()
+    has_ass = ass_path is not None and Path(ass_path).exists()
+    has_subtitles = has_ass or (srt_path and srt_path.exists())
 
     if show_waveform:
         # Waveform visualization: show audio as oscilloscope at bottom
@@ -207,7 +319,12 @@ def assemble_video(
     else:
         video_label = "[0:v]"
 
-    if has_subtitles:
+    if has_ass:
+        # Styles are baked into the file, so no force_style re-styling pass
+        ass_escaped = str(ass_path).replace(":", r"\:").replace("'", r"\'")
+        filters.append(f"{video_label}subtitles='{ass_escaped}'[vout]")
+        video_label = "[vout]"
+    elif has_subtitles:
         srt_escaped = str(srt_path).replace(":", r"\:").replace("'", r"\'")
         subtitle_style = (
             f"FontSize={subtitle_font_size},"
@@ -226,13 +343,18 @@ def assemble_video(
         )
         video_label = "[vout]"
 
-    # Build ffmpeg command
-    cmd = [
-        "ffmpeg", "-y",
+    # Build ffmpeg command. Without a waveform the picture only changes at
+    # subtitle cues, so loop the background at a low rate instead of
+    # encoding ~25 identical frames a second.
+    cmd = ["ffmpeg", "-y"]
+    if not show_waveform:
+        static_fps = _SUBTITLE_FPS if has_subtitles else _STATIC_FPS
+        cmd.extend(["-framerate", str(static_fps)])
+    cmd.extend([
         "-loop", "1",
         "-i", str(background_path),
         "-i", str(audio_path),
-    ]
+    ])
 
     if filters:
         filter_complex = ";".join(filters)
@@ -241,21 +363,36 @@ def assemble_video(
     else:
         cmd.extend(["-map", "0:v", "-map", "1:a"])
 
-    cmd.extend([
-        "-c:v", "libx264",
-        "-tune", "stillimage",
+    output_args = [
         "-c:a", "aac",
         "-b:a", audio_bitrate,
         "-pix_fmt", "yuv420p",
         "-shortest",
-    ])
+    ]
 
     if duration:
-        cmd.extend(["-t", str(duration)])
-
-    cmd.append(str(output_path))
-
-    result = subprocess.run(cmd, capture_output=True, text=True)
+        output_args.extend(["-t", str(duration)])
+
+    output_args.append(str(output_path))
+
+    def encode(codec: str) -> subprocess.CompletedProcess:
+        codec_args = ["-c:v", codec, *_ENCODER_ARGS.get(codec, [])]
+        return subprocess.run(cmd + codec_args + output_args, capture_output=True, text=True)
+
+    codec = _resolve_video_codec(video_codec)
+    result = encode(codec)
+
+    if (
+        result.returncode != 0
+        and codec in _HW_ENCODERS
+        and video_codec == "auto"
+        and _is_encoder_init_error(result.stderr)
+    ):
+        # Listed by -encoders doesn't mean a device is present; remember the
+        # failure so later episodes go straight to software encoding. Other
+        # errors (bad paths, full disk) would fail with libx264 too.
+        _failed_encoders.add(codec)
+        result = encode("libx264")
 
     if result.returncode != 0:
         raise RuntimeError(
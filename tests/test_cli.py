@@ -1,6 +1,14 @@
 """Tests for CLI argument parsing."""
 
-from podclaw.cli import _parse_duration
+import subprocess
+import sys
+import tempfile
+from pathlib import Path
+
+import pytest
+
+from podclaw import cli
+from podclaw.cli import _parse_duration, _progress_callback, _read_script
 
 
 class TestParseDuration:
@@ -15,9 +23,73 @@ class TestParseDuration:
     def test_combined(self):
         assert _parse_duration("1m30s") == 90
         assert _parse_duration("2m15s") == 135
+        assert _parse_duration("2m30") == 150
 
     def test_raw_number(self):
         assert _parse_duration("60") == 60
 
     def test_whitespace(self):
         assert _parse_duration("  2m  ") == 120
+        assert _parse_duration("1m 30s") == 90
+        assert _parse_duration("2 m") == 120
+        assert _parse_duration("90 s") == 90
+        assert _parse_duration("1 m 30 s") == 90
+
+    def test_uppercase(self):
+        assert _parse_duration("1M30S") == 90
+
+    @pytest.mark.parametrize("value", ["", "abc", "30s1m", "1h", "m", "s"])
+    def test_invalid(self, value):
+        with pytest.raises(ValueError):
+            _parse_duration(value)
+
+
+class TestReadScript:
+    def _read(self, data):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            path = Path(tmpdir) / "script.txt"
+            path.write_bytes(data)
+            return _read_script(str(path))
+
+    def test_normalizes_newlines(self):
+        assert self._read(b"[A] one\r\n[B] two\r[A] three\n") == "[A] one\n[B] two\n[A] three\n"
+
+    def test_size_cap(self, monkeypatch):
+        monkeypatch.setattr(cli, "_MAX_SCRIPT_BYTES", 8)
+        assert self._read(b"[A] 1234") == "[A] 1234"
+        with pytest.raises(ValueError, match="too large"):
+            self._read(b"[A] 12345")
+
+    def test_invalid_utf8(self):
+        with pytest.raises(ValueError, match="not valid UTF-8"):
+            self._read(b"[A] \xff")
+
+
+class TestProgressCallback:
+    def test_writes_line(self, capsys):
+        _progress_callback("tts", "Synthesized segment 1/2 [HOST]")
+        _progress_callback("mystery", "Working")
+        out = capsys.readouterr().out
+        assert out == "  🎙️ [tts] Synthesized segment 1/2 [HOST]\n  ⏳ [mystery] Working\n"
+
+    def test_flushes_tts_lines(self, monkeypatch):
+        class Stdout:
+            def __init__(self):
+                self.unflushed = ""
+
+            def write(self, text):
+                self.unflushed += text
+
+            def flush(self):
+                self.unflushed = ""
+
+        stdout = Stdout()
+        monkeypatch.setattr(sys, "stdout", stdout)
+        _progress_callback("tts", "Synthesized segment 1/2 [HOST]")
+        assert stdout.unflushed == ""
+
+
+class TestImports:
+    def test_cli_does_not_import_pipeline(self):
+        code = "import sys, podclaw.cli; assert 'podclaw.generator' not in sys.modules"
+        subprocess.run([sys.executable, "-c", code], cwd=Path(__file__).parents[1], check=True)
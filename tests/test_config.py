@@ -30,6 +30,29 @@ class TestVoiceResolution:
         voice = config.get_voice("some_random_id_123")
         assert voice.voice_id == "some_random_id_123"
 
+    def test_lookups_are_memoized(self):
+        config = PodclawConfig()
+        assert config.get_voice("some_random_id_123") is config.get_voice("some_random_id_123")
+        assert "_voice_cache" not in repr(config)
+
+    def test_memo_sees_new_custom_voices(self):
+        config = PodclawConfig()
+        assert config.get_voice("roger").name == "Roger"
+
+        config.custom_voices["roger"] = Voice(name="Other Roger", voice_id="xyz")
+        assert config.get_voice("roger").voice_id == "xyz"
+
+        config.custom_voices = {}
+        assert config.get_voice("roger").name == "Roger"
+
+    def test_memo_sees_replaced_custom_voice(self):
+        config = PodclawConfig(custom_voices={"host": Voice(name="A", voice_id="a")})
+        assert config.get_voice("host").voice_id == "a"
+
+        config.custom_voices["host"] = Voice(name="C", voice_id="c")
+        assert config.get_voice("host").voice_id == "c"
+        assert config.get_voice("HOST").voice_id == "c"
+
     def test_get_all_voices(self):
         config = PodclawConfig(voices=["roger", "george", "callum"])
         voices = config.get_all_voices()
@@ -50,6 +73,10 @@ class TestBuiltinVoices:
         assert "george" in VOICES
         assert "callum" in VOICES
 
+    def test_read_only(self):
+        with pytest.raises(TypeError):
+            VOICES["new"] = Voice(name="New", voice_id="new")
+
 
 class TestFormat:
     def test_all_formats(self):
@@ -0,0 +1,123 @@
+"""Tests for the generation pipeline helpers."""
+
+import errno
+import os
+import tempfile
+from pathlib import Path
+
+import pytest
+
+from podclaw import generator
+
+
+class TestPublish:
+    def test_moves_file(self):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            src = Path(tmpdir) / "work" / "combined.mp3"
+            src.parent.mkdir()
+            src.write_bytes(b"audio")
+            dst = Path(tmpdir) / "episode.mp3"
+
+            generator._publish(src, dst)
+
+            assert dst.read_bytes() == b"audio"
+            assert not src.exists()
+
+    def test_falls_back_to_copy_across_devices(self, monkeypatch):
+        def cross_device(src, dst):
+            raise OSError(errno.EXDEV, os.strerror(errno.EXDEV))
+
+        monkeypatch.setattr(generator.os, "replace", cross_device)
+        with tempfile.TemporaryDirectory() as tmpdir:
+            src = Path(tmpdir) / "a.srt"
+            src.write_text("1\n")
+            dst = Path(tmpdir) / "b.srt"
+
+            generator._publish(src, dst)
+
+            assert dst.read_text() == "1\n"
+
+
+class TestSafeTable:
+    def test_strips_unsafe_characters(self):
+        topic = "Is AI conscious? (Part 2) — yes/no"
+        expected = "".join(c for c in topic if c.isalnum() or c in " -_")
+        assert topic.translate(generator._SAFE_TABLE) == expected
+
+    def test_keeps_unicode_letters(self):
+        assert "Café über 東京!".translate(generator._SAFE_TABLE) == "Café über 東京"
+
+
+class TestPickTmpRoot:
+    def test_rejects_low_free_space(self, monkeypatch):
+        class Usage:
+            free = 1024
+
+        monkeypatch.setattr(generator.os.path, "isdir", lambda p: True)
+        monkeypatch.setattr(generator.os, "access", lambda p, mode: True)
+        monkeypatch.setattr(generator.shutil, "disk_usage", lambda p: Usage())
+        assert generator._pick_tmp_root() is None
+
+    def test_missing_shm(self, monkeypatch):
+        monkeypatch.setattr(generator.os.path, "isdir", lambda p: False)
+        assert generator._pick_tmp_root() is None
+
+
+class TestCheckOutputDir:
+    def test_creates_directory(self):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            out = Path(tmpdir) / "episodes" / "new"
+            generator._check_output_dir(out)
+            assert out.is_dir()
+            assert list(out.iterdir()) == []
+
+    def test_probe_name_is_unique(self):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            # Stands in for another run's probe at the old fixed name
+            (Path(tmpdir) / ".podclaw_probe").mkdir()
+            generator._check_output_dir(Path(tmpdir))
+            assert [p.name for p in Path(tmpdir).iterdir()] == [".podclaw_probe"]
+
+    def test_rejects_low_free_space(self, monkeypatch):
+        class Usage:
+            free = 10 * 1024 * 1024
+
+        monkeypatch.setattr(generator.shutil, "disk_usage", lambda p: Usage())
+        with tempfile.TemporaryDirectory() as tmpdir:
+            with pytest.raises(ValueError, match="free space"):
+                generator._check_output_dir(Path(tmpdir))
+
+    def test_rejects_file_path(self):
+        with tempfile.NamedTemporaryFile() as f:
+            with pytest.raises(ValueError, match="not writable"):
+                generator._check_output_dir(Path(f.name))
+
+
+class TestDefaultOutputName:
+    def test_slug_and_digest(self):
+        name = generator._default_output_name("Is AI conscious?")
+        assert name.startswith("podclaw_Is_AI_conscious_")
+        assert name.endswith(".mp4")
+
+    def test_shared_prefix_does_not_collide(self):
+        prefix = "A very long topic title that goes on and on and on "
+        a = generator._default_output_name(prefix + "part one")
+        b = generator._default_output_name(prefix + "part two")
+        assert a != b
+
+    def test_deterministic(self):
+        assert generator._default_output_name("x") == generator._default_output_name("x")
+
+
+class TestTtsCacheDir:
+    def test_default_location(self):
+        path = generator._tts_cache_dir(generator.PodclawConfig())
+        assert path == Path("~/.cache/podclaw/tts").expanduser()
+
+    def test_custom_location(self):
+        config = generator.PodclawConfig(cache_dir="/tmp/tts-cache")
+        assert generator._tts_cache_dir(config) == Path("/tmp/tts-cache")
+
+    def test_disabled(self):
+        config = generator.PodclawConfig(use_tts_cache=False, cache_dir="/tmp/tts-cache")
+        assert generator._tts_cache_dir(config) is None
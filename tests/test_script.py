@@ -9,6 +9,7 @@ from podclaw.script import (
     generate_prompt,
     estimate_word_count,
     format_duration,
+    split_speaker_tag,
     SPEAKER_ROLES,
 )
 
@@ -24,6 +25,7 @@ class TestParseScript:
         assert segments[0]["text"] == "Hello there!"
         assert segments[1]["speaker"] == "HOST_B"
         assert segments[2]["speaker"] == "HOST_A"
+        assert segments[0]["speaker"] is segments[2]["speaker"]
 
     def test_multiline_text(self):
         script = """[HOST] This is the first line.
@@ -40,6 +42,31 @@ And this continues on the next line.
     def test_no_tags(self):
         assert parse_script("Just some text without tags") == []
 
+    def test_edge_cases(self):
+        script = """Preamble is dropped.
+  [ HOST_A ]  Indented tag, padded speaker.
+[not a tag line
+[HOST_B]
+[HOST_A] First ] closes [the] tag.
+[] Nobody speaks.
+[HOST_B]\tTabs\tand   spaces.\r
+"""
+        assert parse_script(script) == [
+            {"speaker": "HOST_A", "text": "Indented tag, padded speaker. [not a tag line"},
+            {"speaker": "HOST_A", "text": "First ] closes [the] tag."},
+            {"speaker": "HOST_B", "text": "Tabs and spaces."},
+        ]
+
+
+class TestSplitSpeakerTag:
+    def test_tagged_line(self):
+        assert split_speaker_tag("  [ HOST_A ]  Hello ] there ") == ("HOST_A", "Hello ] there")
+        assert split_speaker_tag("[]") == ("", "")
+
+    def test_untagged_line(self):
+        assert split_speaker_tag("  just text\r") == (None, "just text")
+        assert split_speaker_tag("[no close") == (None, "[no close")
+
 
 class TestAssignVoices:
     def test_voice_assignment(self):
@@ -54,6 +81,7 @@ class TestAssignVoices:
         assert result[0]["voice"].name == "Roger"
         assert result[1]["voice"].name == "George"
         assert result[2]["voice"].name == "Roger"  # Same speaker = same voice
+        assert result is segments  # Assigned in place
 
     def test_single_voice_wraps(self):
         segments = [
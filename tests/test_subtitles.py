@@ -3,7 +3,14 @@
 import tempfile
 from pathlib import Path
 
-from podclaw.subtitles import generate_srt, generate_srt_from_text, _format_srt_time, _split_long_text
+from podclaw.subtitles import (
+    generate_ass,
+    generate_srt,
+    generate_srt_from_text,
+    _format_ass_time,
+    _format_srt_time,
+    _split_long_text,
+)
 
 
 class TestFormatTime:
@@ -23,6 +30,13 @@ class TestFormatTime:
         assert _format_srt_time(3661500) == "01:01:01,500"
 
 
+class TestFormatAssTime:
+    def test_centiseconds(self):
+        assert _format_ass_time(0) == "0:00:00.00"
+        assert _format_ass_time(3265) == "0:00:03.27"
+        assert _format_ass_time(3661500) == "1:01:01.50"
+
+
 class TestSplitText:
     def test_short_text(self):
         assert _split_long_text("Hello world", 80) == ["Hello world"]
@@ -33,6 +47,13 @@ class TestSplitText:
         assert len(chunks) > 1
         assert all(len(c) <= 45 for c in chunks)  # Some slack for word boundaries
 
+    def test_packing(self):
+        assert _split_long_text("aaaa bbbb cccc dddd", 9) == ["aaaa", "bbbb cccc", "dddd"]
+
+    def test_long_word_and_whitespace(self):
+        text = "hi  supercalifragilistic\tthere"
+        assert _split_long_text(text, 10) == ["hi", "supercalifragilistic", "there"]
+
 
 class TestGenerateSrt:
     def test_basic_generation(self):
@@ -54,6 +75,24 @@ class TestGenerateSrt:
             assert "00:00:00,000" in content
             assert "00:00:03,000" in content
 
+    def test_exact_format(self):
+        segments = [
+            {"speaker": "HOST", "text": "One."},
+            {"speaker": "HOST", "text": "Two."},
+        ]
+        timings = [
+            {"start_ms": 0, "end_ms": 1000},
+            {"start_ms": 1400, "end_ms": 2500},
+        ]
+
+        with tempfile.TemporaryDirectory() as tmpdir:
+            path = generate_srt(segments, timings, Path(tmpdir) / "test.srt")
+            assert path.read_text() == (
+                "1\n00:00:00,000 --> 00:00:01,000\nOne.\n"
+                "\n"
+                "2\n00:00:01,400 --> 00:00:02,500\nTwo.\n"
+            )
+
     def test_with_speaker_names(self):
         segments = [{"speaker": "HOST_A", "text": "Hi!"}]
         timings = [{"start_ms": 0, "end_ms": 2000}]
@@ -65,6 +104,33 @@ class TestGenerateSrt:
             assert "[HOST_A]" in content
 
 
+class TestGenerateAss:
+    def test_style_and_events(self):
+        segments = [{"speaker": "HOST", "text": "Hello there!"}]
+        timings = [{"start_ms": 0, "end_ms": 1500}]
+
+        with tempfile.TemporaryDirectory() as tmpdir:
+            path = generate_ass(
+                segments, timings, Path(tmpdir) / "test.ass", font_size=32, margin_v=40
+            )
+            content = path.read_text()
+
+        assert "PlayResY: 288" in content
+        assert "Style: Default,Arial,32," in content
+        assert ",10,10,40,1\n" in content
+        assert content.endswith("Dialogue: 0,0:00:00.00,0:00:01.50,Default,,0,0,0,,Hello there!\n")
+
+    def test_markup_converted_like_ffmpeg(self):
+        text = "<i>So</i> <B>loud</B><br><font color=red>red</font> 1 < 2"
+        segments = [{"speaker": "HOST", "text": text}]
+        timings = [{"start_ms": 0, "end_ms": 1500}]
+
+        with tempfile.TemporaryDirectory() as tmpdir:
+            content = generate_ass(segments, timings, Path(tmpdir) / "test.ass").read_text()
+
+        assert content.endswith(r"{\i1}So{\i0} {\b1}loud{\b0}\Nred 1 < 2" + "\n")
+
+
 class TestGenerateSrtFromText:
     def test_basic(self):
         text = "[HOST] Hello!\n[HOST] World!"
@@ -0,0 +1,233 @@
+"""Tests for TTS orchestration (network calls are stubbed out)."""
+
+import random
+import tempfile
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+import pytest
+
+from podclaw import tts
+from podclaw.config import VOICES
+
+
+def _fake_synthesize(text, voice, api_key, output_path):
+    time.sleep(random.uniform(0, 0.01))
+    output_path.write_bytes(text.encode("utf-8"))
+    return output_path
+
+
+class TestSynthesizeAllSegments:
+    def test_results_and_progress_in_order(self, monkeypatch):
+        monkeypatch.setattr(tts, "synthesize_segment", _fake_synthesize)
+        segments = [
+            {"speaker": "HOST", "text": f"Line {i}", "voice": VOICES["roger"]}
+            for i in range(20)
+        ]
+        calls = []
+
+        with tempfile.TemporaryDirectory() as tmpdir:
+            results = tts.synthesize_all_segments(
+                segments,
+                api_key="key",
+                work_dir=Path(tmpdir),
+                on_progress=lambda cur, total, seg: calls.append((cur, total, seg["text"])),
+                max_workers=8,
+            )
+            assert [r["text"] for r in results] == [s["text"] for s in segments]
+            for i, r in enumerate(results):
+                assert Path(r["audio_path"]).read_text() == f"Line {i}"
+
+        assert calls == [(i + 1, 20, f"Line {i}") for i in range(20)]
+
+    def test_shared_executor_respects_max_workers(self, monkeypatch):
+        lock = threading.Lock()
+        in_flight = peak = 0
+
+        def tracking(text, voice, api_key, output_path):
+            nonlocal in_flight, peak
+            with lock:
+                in_flight += 1
+                peak = max(peak, in_flight)
+            time.sleep(0.005)
+            with lock:
+                in_flight -= 1
+            return _fake_synthesize(text, voice, api_key, output_path)
+
+        monkeypatch.setattr(tts, "synthesize_segment", tracking)
+        segments = [
+            {"speaker": "HOST", "text": f"Line {i}", "voice": VOICES["roger"]}
+            for i in range(12)
+        ]
+
+        with tempfile.TemporaryDirectory() as tmpdir, ThreadPoolExecutor(8) as executor:
+            results = tts.synthesize_all_segments(
+                segments, "key", Path(tmpdir), max_workers=2, executor=executor
+            )
+
+        assert len(results) == 12
+        assert peak <= 2
+
+    def test_error_propagates(self, monkeypatch):
+        def failing(text, voice, api_key, output_path):
+            raise RuntimeError("boom")
+
+        monkeypatch.setattr(tts, "synthesize_segment", failing)
+        segments = [{"speaker": "HOST", "text": "Hi", "voice": VOICES["roger"]}]
+
+        with tempfile.TemporaryDirectory() as tmpdir:
+            with pytest.raises(RuntimeError, match="boom"):
+                tts.synthesize_all_segments(segments, "key", Path(tmpdir))
+
+
+class TestCache:
+    def test_cache_hit_skips_synthesis(self, monkeypatch):
+        calls = []
+
+        def counting(text, voice, api_key, output_path):
+            calls.append(text)
+            return _fake_synthesize(text, voice, api_key, output_path)
+
+        monkeypatch.setattr(tts, "synthesize_segment", counting)
+        segments = [{"speaker": "HOST", "text": "Hello", "voice": VOICES["roger"]}]
+
+        with tempfile.TemporaryDirectory() as tmpdir:
+            cache_dir = Path(tmpdir) / "cache"
+            for run in ("a", "b"):
+                results = tts.synthesize_all_segments(
+                    segments, "key", Path(tmpdir) / run, cache_dir=cache_dir
+                )
+                assert Path(results[0]["audio_path"]).read_text() == "Hello"
+
+        assert calls == ["Hello"]
+
+    def test_key_depends_on_voice_settings(self):
+        roger = VOICES["roger"]
+        george = VOICES["george"]
+        assert tts._cache_key("Hi", roger) == tts._cache_key("Hi", roger)
+        assert tts._cache_key("Hi", roger) != tts._cache_key("Hi", george)
+        assert tts._cache_key("Hi", roger) != tts._cache_key("Hi!", roger)
+
+
+class TestDeduplication:
+    def test_repeated_lines_synthesized_once(self, monkeypatch):
+        calls = []
+
+        def counting(text, voice, api_key, output_path):
+            calls.append((voice.name, text))
+            return _fake_synthesize(text, voice, api_key, output_path)
+
+        monkeypatch.setattr(tts, "synthesize_segment", counting)
+        roger, george = VOICES["roger"], VOICES["george"]
+        segments = [
+            {"speaker": "A", "text": "Right.", "voice": roger},
+            {"speaker": "B", "text": "Right.", "voice": george},
+            {"speaker": "A", "text": "Right.", "voice": roger},
+            {"speaker": "A", "text": "Moving on.", "voice": roger},
+        ]
+
+        with tempfile.TemporaryDirectory() as tmpdir:
+            results = tts.synthesize_all_segments(segments, "key", Path(tmpdir))
+            paths = [r["audio_path"] for r in results]
+            assert len(set(paths)) == 4
+            assert Path(paths[2]).read_text() == "Right."
+
+        assert sorted(calls) == [("George", "Right."), ("Roger", "Moving on."), ("Roger", "Right.")]
+
+
+class TestSession:
+    def test_session_is_shared(self):
+        assert tts._get_session() is tts._get_session()
+
+    def test_response_streamed_to_file(self, monkeypatch):
+        class FakeResponse:
+            def __enter__(self):
+                return self
+
+            def __exit__(self, *exc):
+                return False
+
+            def raise_for_status(self):
+                pass
+
+            def iter_content(self, chunk_size):
+                yield b"ID3"
+                yield b"audio"
+
+        class FakeSession:
+            def post(self, url, **kwargs):
+                assert kwargs["stream"] is True
+                return FakeResponse()
+
+        monkeypatch.setattr(tts, "_get_session", FakeSession)
+
+        with tempfile.TemporaryDirectory() as tmpdir:
+            path = tts.synthesize_segment("Hi", VOICES["roger"], "key", Path(tmpdir) / "a.mp3")
+            assert path.read_bytes() == b"ID3audio"
+
+
+class TestRateLimiter:
+    def test_spaces_out_requests(self):
+        limiter = tts._RateLimiter(rate_per_min=6000)  # one per 10 ms
+        start = time.monotonic()
+        for _ in range(5):
+            limiter.acquire()
+        assert time.monotonic() - start >= 0.035
+
+    def test_burst_capped_at_rate(self):
+        limiter = tts._RateLimiter(rate_per_min=2, burst=4)
+        start = time.monotonic()
+        limiter.acquire()
+        limiter.acquire()
+        assert time.monotonic() - start < 0.5
+        assert limiter._capacity == 2
+
+    @pytest.mark.parametrize("rate", [0, -5])
+    def test_rejects_non_positive_rate(self, rate):
+        with pytest.raises(ValueError, match="positive"):
+            tts._RateLimiter(rate_per_min=rate)
+
+    def test_burst_is_immediate(self):
+        limiter = tts._RateLimiter(rate_per_min=3, burst=3)
+        start = time.monotonic()
+        for _ in range(3):
+            limiter.acquire()
+        assert time.monotonic() - start < 0.5
+
+
+def _mp3_frames(count, header=b"\xff\xfb\x90\xc0", frame_len=417):
+    """MPEG-1 Layer III, 128 kbps, 44.1 kHz, mono frames with empty payloads."""
+    return (header + bytes(frame_len - 4)) * count
+
+
+class TestMp3Duration:
+    def _duration(self, data):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            path = Path(tmpdir) / "a.mp3"
+            path.write_bytes(data)
+            return tts._mp3_duration_ms(str(path))
+
+    def test_frame_walk(self):
+        assert self._duration(_mp3_frames(100)) == 100 * 1152 * 1000 // 44100
+
+    def test_skips_id3_tags(self):
+        id3v2 = b"ID3\x04\x00\x00\x00\x00\x00\x0a" + bytes(10)
+        id3v1 = b"TAG" + bytes(125)
+        assert self._duration(id3v2 + _mp3_frames(10) + id3v1) == 10 * 1152 * 1000 // 44100
+
+    def test_xing_frame_not_counted(self):
+        xing = bytearray(_mp3_frames(1))
+        xing[4 + 17:4 + 21] = b"Info"
+        assert self._duration(bytes(xing) + _mp3_frames(10)) == 10 * 1152 * 1000 // 44100
+
+    def test_mixed_sample_rates(self):
+        # Stream-copied concat can join segments encoded at different rates
+        mpeg2 = _mp3_frames(10, header=b"\xff\xf3\x80\xc0", frame_len=208)  # 22.05 kHz
+        expected = int((10 * 1152 / 44100 + 10 * 576 / 22050) * 1000)
+        assert self._duration(_mp3_frames(10) + mpeg2) == expected
+
+    def test_not_mp3(self):
+        assert self._duration(b"RIFF" + bytes(100)) is None
+        assert tts._mp3_duration_ms("/nonexistent/missing.mp3") is None
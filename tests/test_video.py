@@ -0,0 +1,111 @@
+"""Tests for background rendering."""
+
+import subprocess
+import tempfile
+from pathlib import Path
+
+import pytest
+
+from podclaw import video
+from podclaw.video import _load_font, create_background
+
+
+class TestCreateBackground:
+    def test_vertical_gradient(self):
+        from PIL import Image
+
+        with tempfile.TemporaryDirectory() as tmpdir:
+            path = create_background(Path(tmpdir) / "bg.png", width=320, height=200)
+            img = Image.open(path).convert("RGB")
+            assert img.size == (320, 200)
+            assert img.getpixel((160, 0)) == (10, 22, 40)
+            # Darkens by up to 20% towards the bottom
+            assert img.getpixel((160, 199)) == (8, 17, 32)
+            assert img.getpixel((5, 100)) == img.getpixel((315, 100))
+
+
+class TestFonts:
+    def test_fonts_are_cached(self):
+        assert _load_font(22) is _load_font(22)
+        assert _load_font(22) is not _load_font(36)
+
+
+class TestVideoCodec:
+    def test_explicit_codec_is_kept(self):
+        assert video._resolve_video_codec("libx265") == "libx265"
+
+    def test_auto_prefers_hardware(self, monkeypatch):
+        monkeypatch.setattr(
+            video, "_available_encoders", lambda: frozenset({"libx264", "h264_qsv"})
+        )
+        assert video._resolve_video_codec("auto") == "h264_qsv"
+
+    def test_auto_without_hardware(self, monkeypatch):
+        monkeypatch.setattr(video, "_available_encoders", lambda: frozenset({"libx264"}))
+        assert video._resolve_video_codec("auto") == "libx264"
+
+    def test_falls_back_to_libx264(self, monkeypatch):
+        monkeypatch.setattr(video, "_available_encoders", lambda: frozenset({"h264_nvenc"}))
+        monkeypatch.setattr(video, "_failed_encoders", set())
+        codecs = []
+
+        def fake_run(cmd, **kwargs):
+            codec = cmd[cmd.index("-c:v") + 1]
+            codecs.append(codec)
+            if codec == "h264_nvenc":
+                return subprocess.CompletedProcess(
+                    cmd, 1, "", "[h264_nvenc] No capable devices found"
+                )
+            return subprocess.CompletedProcess(cmd, 0, "", "")
+
+        monkeypatch.setattr(video.subprocess, "run", fake_run)
+
+        with tempfile.TemporaryDirectory() as tmpdir:
+            out = Path(tmpdir) / "out.mp4"
+            video.assemble_video(Path("bg.png"), Path("a.mp3"), out, show_waveform=False)
+            video.assemble_video(Path("bg.png"), Path("a.mp3"), out, show_waveform=False)
+
+        assert codecs == ["h264_nvenc", "libx264", "libx264"]
+
+    def test_other_errors_not_retried(self, monkeypatch):
+        monkeypatch.setattr(video, "_available_encoders", lambda: frozenset({"h264_nvenc"}))
+        monkeypatch.setattr(video, "_failed_encoders", set())
+        codecs = []
+
+        def fake_run(cmd, **kwargs):
+            codecs.append(cmd[cmd.index("-c:v") + 1])
+            return subprocess.CompletedProcess(cmd, 1, "", "a.mp3: No such file or directory")
+
+        monkeypatch.setattr(video.subprocess, "run", fake_run)
+
+        with tempfile.TemporaryDirectory() as tmpdir:
+            out = Path(tmpdir) / "out.mp4"
+            with pytest.raises(RuntimeError, match="No such file"):
+                video.assemble_video(Path("bg.png"), Path("a.mp3"), out, show_waveform=False)
+
+        assert codecs == ["h264_nvenc"]
+        assert video._failed_encoders == set()
+
+
+class TestStaticFrameRate:
+    def _command(self, monkeypatch, **kwargs):
+        commands = []
+
+        def fake_run(cmd, **run_kwargs):
+            commands.append(cmd)
+            return subprocess.CompletedProcess(cmd, 0, "", "")
+
+        monkeypatch.setattr(video.subprocess, "run", fake_run)
+        with tempfile.TemporaryDirectory() as tmpdir:
+            video.assemble_video(
+                Path("bg.png"), Path("a.mp3"), Path(tmpdir) / "out.mp4",
+                video_codec="libx264", **kwargs,
+            )
+        return commands[0]
+
+    def test_no_waveform_uses_low_rate(self, monkeypatch):
+        cmd = self._command(monkeypatch, show_waveform=False)
+        assert cmd[cmd.index("-framerate") + 1] == str(video._STATIC_FPS)
+
+    def test_waveform_keeps_default_rate(self, monkeypatch):
+        assert "-framerate" not in self._command(monkeypatch, show_waveform=True)